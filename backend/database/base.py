@@ -34,6 +34,11 @@ class DatabaseInterface(ABC):
         """Retrieve all biofiles present in the database"""
         pass
 
+    @abstractmethod
+    async def retrieve_biofile_stats(self) -> Dict | None:
+        """Retrieve aggregated statistics of all biofiles in the database"""
+        pass
+
     @abstractmethod
     async def retrieve_biofile_by_id(self, biofile_id: str) -> Dict | None:
         """Retrieve a biofile with a matching ID"""
@@ -56,11 +61,16 @@ class DatabaseInterface(ABC):
 
     @abstractmethod
     async def retrieve_biofiles_by_search(
-        self, search: SearchModel
+        self, search: SearchModel, limit: int | None = None, offset: int = 0
     ) -> List[Dict] | None:
         """Retrieve biofiles with a matching search query"""
         pass
 
+    @abstractmethod
+    async def count_biofiles_by_search(self, search: SearchModel) -> int | None:
+        """Count biofiles with a matching search query"""
+        pass
+
     @abstractmethod
     async def check_database(self) -> bool | None:
         """Check if the database is available"""
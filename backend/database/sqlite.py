@@ -172,6 +172,63 @@ class SQLiteDatabase(DatabaseInterface):
 
             return biofiles
 
+    async def retrieve_biofile_stats(self) -> Dict | None:
+        """Retrieve aggregated statistics of all biofiles in the database"""
+        # The result columns are named like the filecontext keys they come from.
+        # WHERE and GROUP BY refer to the expressions or column positions, so they
+        # never resolve against a column of the biofiles table.
+        queries = {
+            "date": (
+                "SELECT json_extract(filecontext, '$.date') AS date, COUNT(*) AS count, "
+                "SUM(filesize) AS filesize_sum, AVG(filesize) AS filesize_mean "
+                "FROM biofiles WHERE json_extract(filecontext, '$.date') IS NOT NULL "
+                "GROUP BY 1 ORDER BY 1"
+            ),
+            "creationDate": (
+                "SELECT substr(json_extract(filecontext, '$.creationDate'), 1, 10) "
+                "AS creationDate, COUNT(*) AS count FROM biofiles "
+                "WHERE json_extract(filecontext, '$.creationDate') IS NOT NULL "
+                "GROUP BY 1 ORDER BY 1"
+            ),
+            "species": (
+                "SELECT json_extract(filecontext, '$.species') AS species, COUNT(*) AS count "
+                "FROM biofiles WHERE json_extract(filecontext, '$.species') IS NOT NULL "
+                "GROUP BY 1 ORDER BY 2 DESC"
+            ),
+            "experimenter": (
+                "SELECT json_each.value AS experimenter, COUNT(*) AS count "
+                "FROM biofiles, json_each(biofiles.filecontext, '$.experimenter') "
+                "GROUP BY 1 ORDER BY 2 DESC"
+            ),
+            "labDeviceType": (
+                "SELECT json_extract(filecontext, '$.labDeviceType') AS labDeviceType, "
+                "COUNT(*) AS count FROM biofiles "
+                "WHERE json_extract(filecontext, '$.labDeviceType') IS NOT NULL "
+                "GROUP BY 1 ORDER BY 2 DESC"
+            ),
+            "subject": (
+                "SELECT json_extract(filecontext, '$.species') AS species, "
+                "json_extract(filecontext, '$.origin') AS origin, "
+                "json_extract(filecontext, '$.organType') AS organType, "
+                "json_extract(filecontext, '$.cellType') AS cellType, "
+                "SUM(filesize) AS filesize FROM biofiles "
+                "GROUP BY 1, 2, 3, 4"
+            ),
+        }
+
+        async with sessionmanager.session() as session:
+            result = await session.execute(
+                text("SELECT COUNT(*), COALESCE(SUM(filesize), 0) FROM biofiles")
+            )
+            total_count, total_size = result.one()
+            stats = {"total_count": total_count, "total_size": total_size}
+
+            for key, stmt in queries.items():
+                result = await session.execute(text(stmt))
+                stats[key] = [dict(row) for row in result.mappings()]
+
+            return stats
+
     async def retrieve_biofile_by_id(self, biofile_id: str) -> Dict | None:
         """Retrieve a biofile with a matching ID"""
         async with sessionmanager.session() as session:
@@ -274,13 +331,9 @@ class SQLiteDatabase(DatabaseInterface):
         else:
             return "unknown"
 
-    async def retrieve_biofiles_by_search(
-        self, search: SearchModel
-    ) -> List[Dict] | None:
+    def search_conditions(self, search: SearchModel) -> str:
         # pylint: disable=line-too-long
-        """Retrieve biofiles with a matching search query"""
-        stmt = "SELECT * FROM biofiles WHERE "
-
+        """Build the WHERE clause of a search query, empty if nothing is searched"""
         search_dict = dict(search)
 
         conditions = []
@@ -370,10 +423,20 @@ class SQLiteDatabase(DatabaseInterface):
                     )
 
         if conditions:
-            stmt += " AND ".join(conditions)
-        else:
-            # If there are no conditions, remove the WHERE clause
-            stmt = "SELECT * FROM biofiles"
+            return " WHERE " + " AND ".join(conditions)
+        # If there are no conditions, omit the WHERE clause
+        return ""
+
+    async def retrieve_biofiles_by_search(
+        self, search: SearchModel, limit: int | None = None, offset: int = 0
+    ) -> List[Dict] | None:
+        """Retrieve biofiles with a matching search query"""
+        stmt = "SELECT * FROM biofiles" + self.search_conditions(search)
+        if limit is not None or offset:
+            # stable order so that consecutive pages do not overlap,
+            # sqlite needs a LIMIT for an OFFSET and takes -1 as no limit
+            limit = -1 if limit is None else int(limit)
+            stmt += f" ORDER BY _id LIMIT {limit} OFFSET {int(offset)}"
 
         async with sessionmanager.session() as session:
             result = await session.stream(text(stmt))
@@ -385,6 +448,14 @@ class SQLiteDatabase(DatabaseInterface):
                 biofiles.append(biofile_dict)
             return biofiles
 
+    async def count_biofiles_by_search(self, search: SearchModel) -> int | None:
+        """Count biofiles with a matching search query"""
+        stmt = "SELECT COUNT(*) FROM biofiles" + self.search_conditions(search)
+
+        async with sessionmanager.session() as session:
+            result = await session.execute(text(stmt))
+            return result.scalar_one()
+
     async def check_database(self) -> bool | None:
         """Check if the database is available"""
         # check if the table from above exists
@@ -3,7 +3,7 @@ from typing import List, Optional
 import pathlib
 
 from database.sqlite import SQLiteDatabase
-from fastapi import APIRouter, Body, HTTPException, Path, status
+from fastapi import APIRouter, Body, HTTPException, Path, Query, Response, status
 from fastapi.encoders import jsonable_encoder
 from model.biofile import Biofile, FilecontextOptional
 from model.response import (
@@ -22,6 +22,19 @@ if os.getenv("DATABASE_BACKEND") == "sqlite":
 else:
     raise NotImplementedError("Only SQLite is supported at the moment")
 
+# Default order of the filecontext keys making up the experiment_path
+DEFAULT_KEY_ORDER = (
+    "species",
+    "origin",
+    "organType",
+    "cellType",
+    "experimentName",
+    "influenceGroups",
+    "sampleID",
+    "ageDIV",
+    "labDevice",
+)
+
 
 @router.get(
     "/all",
@@ -44,6 +57,30 @@ async def get_biofiles():
     return biofiles
 
 
+@router.get(
+    "/stats",
+    summary="Retrieve aggregated statistics of all biofiles in the database",
+    response_model=GeneralResponse,
+    responses={
+        status.HTTP_404_NOT_FOUND: {"model": NotFoundResponse},
+    },
+)
+async def get_biofile_stats():
+    stats = await DB.retrieve_biofile_stats()
+
+    if not stats or not stats["total_count"]:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=jsonable_encoder(NotFoundResponse()),
+        )
+
+    return GeneralResponse(
+        data=stats,
+        message="Statistics retrieved successfully",
+        code=status.HTTP_200_OK,
+    )
+
+
 @router.post(
     "/",
     summary="Add a new biofile into to the database",
@@ -172,13 +209,25 @@ async def get_biofile_data_by_hash(filehash: str):
     responses={status.HTTP_404_NOT_FOUND: {"model": NotFoundResponse}},
     response_model_exclude_none=True,
 )
-async def get_biofiles_by_search(search: SearchModel = Body(...)):
-    biofiles = await DB.retrieve_biofiles_by_search(search)
-    if not biofiles:
+async def get_biofiles_by_search(
+    response: Response,
+    search: SearchModel = Body(...),
+    limit: Optional[int] = Query(None, ge=1),
+    offset: int = Query(0, ge=0),
+):
+    if limit is None and not offset:
+        biofiles = await DB.retrieve_biofiles_by_search(search)
+        total = len(biofiles)
+    else:
+        total = await DB.count_biofiles_by_search(search)
+        biofiles = await DB.retrieve_biofiles_by_search(search, limit, offset)
+
+    if not total:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=jsonable_encoder(NotFoundResponse()),
         )
+    response.headers["X-Total-Count"] = str(total)
     return biofiles
 
 
@@ -214,19 +263,10 @@ async def create_filepath(
     try:
         experiment_data = experiment_data.model_dump(exclude_none=False)
         if key_order is None:
-            key_order: List = [
-                "species",
-                "origin",
-                "organType",
-                "cellType",
-                "experimentName",
-                "influenceGroups",
-                "sampleID",
-                "ageDIV",
-                "labDevice",
-            ]
-
-        experiment_path = pathlib.Path("./")
+            key_order = DEFAULT_KEY_ORDER
+
+        # Collect the path segments and build the Path once at the end
+        path_parts: List[str] = ["./"]
 
         chosen_value = "ageNone"
         if experiment_data.get("ageDAP") is not None:
@@ -239,40 +279,35 @@ async def create_filepath(
             if key in ["ageDIV", "ageDAP"]:
                 continue
             elif key == "influenceGroups":
-                influence_groups_dict = [
-                    experiment_data["influenceGroups"][key]
-                    for key in experiment_data["influenceGroups"]
-                    if key.startswith("influence")
-                ]
-                # get all values from the nested dict where the key is 'name'
-                influence_groups = [
+                # get all values from the nested dicts where the key is 'name' and
+                # make them unique keeping the order
+                unique_influence_groups = dict.fromkeys(
                     value["name"]
-                    for influence_group in influence_groups_dict
+                    for group_key, influence_group in experiment_data[
+                        "influenceGroups"
+                    ].items()
+                    if group_key.startswith("influence")
                     for value in influence_group.values()
                     if value is not None
-                ]
-                # make the list unique keeping the order
-                unique_influence_groups = list(dict.fromkeys(influence_groups))
-                experiment_path /= pathlib.Path("_".join(unique_influence_groups))
+                )
+                path_parts.append("_".join(unique_influence_groups))
 
             # Ensure the key is in the experiment_data
             if key in experiment_data:
-                value = experiment_data.get(key)
+                value = experiment_data[key]
 
                 # Check if the value is a dictionary, then concatenate nested keys
                 # This is the case for the device name
                 if isinstance(value, dict):
-                    nested_keys = list(value.keys())
-
                     # Concatenate the values of "name" keys with an underscore
                     nested_values = "_".join(
-                        str(value[nested_key]["name"])
-                        for nested_key in nested_keys
-                        if value[nested_key] is not None and "name" in value[nested_key]
+                        str(nested_value["name"])
+                        for nested_value in value.values()
+                        if nested_value is not None and "name" in nested_value
                     )
 
                     # Concatenate the nested values to the file path
-                    experiment_path /= pathlib.Path(nested_values)
+                    path_parts.append(nested_values)
                 else:
                     # Ensure value is a string representation
                     value_str = str(value)
@@ -281,16 +316,18 @@ async def create_filepath(
                         value_str = "sID" + value_str
 
                     # Concatenate value to the file path
-                    experiment_path /= pathlib.Path(value_str)
+                    path_parts.append(value_str)
 
                 # Insert the chosen value after 'experimentName'
                 if key == "sampleID" and chosen_value is not None:
-                    experiment_path /= pathlib.Path(chosen_value)
+                    path_parts.append(chosen_value)
             elif key == "influence":
                 continue
             else:
                 raise KeyError(f"Key '{key}' not found in experiment_data.")
 
+        experiment_path = pathlib.Path(*path_parts)
+
     except KeyError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -30,13 +30,16 @@ router = APIRouter()
 
 hash_cache = {}
 
+# Read size for hashing, 1 MiB keeps the number of read calls low for large files
+HASH_CHUNK_SIZE = 1 << 20
+
 
 class FileWatcher(FileSystemEventHandler):
     def on_any_event(self, event):
         if event.is_directory:
             return
         hash_cache.pop(pathlib.Path(event.src_path).name, None)
-        logger.info(f"File {event.src_path} has been {event.event_type}")
+        logger.info("File %s has been %s", event.src_path, event.event_type)
         if event.event_type in ["created", "modified", "moved", "closed"]:
             key = pathlib.Path(event.src_path).name
             hash_cache[key] = self.calculate_hash(event.src_path)
@@ -45,7 +48,7 @@ class FileWatcher(FileSystemEventHandler):
         with ProcessPoolExecutor() as executor:
             path = pathlib.Path(directory_path)
             files = [f for f in path.glob("*") if f.is_file()]
-            logger.info(f"files in upload folder: {files}")
+            logger.info("files in upload folder: %s", files)
             results = executor.map(self.calculate_hash, files)
 
         for result in results:
@@ -56,17 +59,17 @@ class FileWatcher(FileSystemEventHandler):
         filepath = pathlib.Path(filepath)
         key = filepath.name
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         if not filepath.is_file():
-            logger.error(f"Hash calculation: File not found at {filepath}")
+            logger.error("Hash calculation: File not found at %s", filepath)
             return
 
         sha256_hash = hashlib.sha256()
 
         try:
             with open(filepath, "rb") as f:
-                # Read and update hash in chunks of 64KB
-                for byte_block in iter(lambda: f.read(65536), b""):
+                # Read and update hash in chunks to keep memory usage constant
+                for byte_block in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
                     sha256_hash.update(byte_block)
         except Exception as e:
             raise HTTPException(
@@ -76,7 +79,7 @@ class FileWatcher(FileSystemEventHandler):
 
         logger.info(
             "Hash calculation completed (%.2fs | %s: %s)",
-            time.time() - start_time,
+            time.perf_counter() - start_time,
             filepath,
             sha256_hash.hexdigest(),
         )
@@ -240,7 +243,9 @@ async def list_files(filepath: str):
     summary="Move a data file with accompanying metadata json-file",
     responses={status.HTTP_200_OK: {"model": GeneralResponse}},
 )
-async def move_file(file_move: FileMove = Body(...)):
+def move_file(file_move: FileMove = Body(...)):
+    # sync endpoint, FastAPI runs it in the threadpool so a copy across
+    # volumes does not block the event loop (e.g. the hash polling)
     try:
         file_move.dstpath.mkdir(parents=True, exist_ok=True)
 
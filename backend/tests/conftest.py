@@ -0,0 +1,69 @@
+import copy
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.pool import NullPool
+
+TESTS_DIR = Path(__file__).resolve().parent
+
+# the backend modules import each other relative to the backend folder
+sys.path.insert(0, str(TESTS_DIR.parent))
+
+NUM_BIOFILES = 53
+DATES = ["2024-04-21", "2024-04-22", "2024-04-23", "2024-05-01"]
+EXPERIMENTERS = [["ADau", "AHes"], ["ADau"], ["JDoe"]]
+SPECIES = ["Human", "Rat"]
+
+
+@pytest.fixture(scope="session")
+def base_metadata():
+    # load from resources file once per test session
+    with open(TESTS_DIR / "resources" / "template_base.json", "r") as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def biofiles(base_metadata):
+    rows = []
+    for i in range(NUM_BIOFILES):
+        filecontext = copy.deepcopy(base_metadata)
+        filecontext["date"] = DATES[i % len(DATES)]
+        filecontext["experimenter"] = EXPERIMENTERS[i % len(EXPERIMENTERS)]
+        filecontext["species"] = SPECIES[i % len(SPECIES)]
+        filecontext["creationDate"] = f"2024-06-0{1 + i % 3}T12:{i % 60:02d}:00.000000"
+        rows.append(
+            {
+                "filecontext": filecontext,
+                "filepath": f"data/file{i}.txt",
+                "filesize": 1000 * (i + 1),
+                "filehash": f"hash{i}",
+                "filetype": ".txt",
+            }
+        )
+    return rows
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch, biofiles):
+    from database import sqlite
+
+    sqlite_file = tmp_path / "CellRexMetadata.sqlite"
+    monkeypatch.setattr(sqlite, "sqlite_file", sqlite_file.as_posix())
+    # every test runs its own event loop, so connections must not be pooled
+    monkeypatch.setattr(
+        sqlite,
+        "sessionmanager",
+        sqlite.DatabaseSessionManager(
+            f"sqlite+aiosqlite:///{sqlite_file.as_posix()}", {"poolclass": NullPool}
+        ),
+    )
+    database = sqlite.SQLiteDatabase()
+    with database.engine.begin() as connection:
+        connection.execute(
+            insert(database.biofile_table),
+            [dict(row, filecontext=json.dumps(row["filecontext"])) for row in biofiles],
+        )
+    return database
@@ -1,4 +1,4 @@
-import json
+import copy
 import pytest
 from pathlib import Path
 
@@ -13,6 +13,20 @@ ORGAN_TYPES = ["Cardio", "Neuro"]
 CELL_TYPES = ["Cardiospheres"]
 
 
+# Default order of the keys making up the file path
+KEY_ORDER = (
+    "species",
+    "origin",
+    "organType",
+    "cellType",
+    "experimentName",
+    "influenceGroups",
+    "sampleID",
+    "ageDIV",
+    "labDevice",
+)
+
+
 def create_filepath_from_keys(
     input_dict,
     key_order: Optional[List[str]] = None,
@@ -23,21 +37,12 @@ def create_filepath_from_keys(
     ATTENTION: This is just copy-pasted code from the frontend.
     """
     if key_order is None:
-        key_order = [
-            "species",
-            "origin",
-            "organType",
-            "cellType",
-            "experimentName",
-            "influenceGroups",
-            "sampleID",
-            "ageDIV",
-            "labDevice",
-        ]
+        key_order = KEY_ORDER
     if input_optionals is None:
         input_optionals = []
 
-    file_path = Path(base_path)
+    # Collect the path segments and build the Path once at the end
+    path_parts = [base_path]
 
     chosen_value = "ageNone"
     if input_dict.get("ageDAP") is not None:
@@ -50,40 +55,33 @@ def create_filepath_from_keys(
         if key in ["ageDIV", "ageDAP"]:
             continue
         elif key == "influenceGroups":
-            influence_groups_dict = [
-                input_dict["influenceGroups"][key]
-                for key in input_dict["influenceGroups"]
-                if key.startswith("influence")
-            ]
-            # get all values from the nested dict where the key is 'name'
-            influence_groups = [
+            # get all values from the nested dicts where the key is 'name' and
+            # make them unique keeping the order
+            unique_influence_groups = dict.fromkeys(
                 value["name"]
-                for influence_group in influence_groups_dict
+                for group_key, influence_group in input_dict["influenceGroups"].items()
+                if group_key.startswith("influence")
                 for value in influence_group.values()
                 if value is not None
-            ]
-            # make the list unique keeping the order
-            unique_influence_groups = list(dict.fromkeys(influence_groups))
-            file_path /= Path("_".join(unique_influence_groups))
+            )
+            path_parts.append("_".join(unique_influence_groups))
 
         # Ensure the key is in the input_dict
         if key in input_dict:
-            value = input_dict.get(key)
+            value = input_dict[key]
 
             # Check if the value is a dictionary, then concatenate nested keys
             # This is the case for the device name
             if isinstance(value, dict):
-                nested_keys = list(value.keys())
-
                 # Concatenate the values of "name" keys with an underscore
                 nested_values = "_".join(
-                    str(value[nested_key]["name"])
-                    for nested_key in nested_keys
-                    if value[nested_key] is not None and "name" in value[nested_key]
+                    str(nested_value["name"])
+                    for nested_value in value.values()
+                    if nested_value is not None and "name" in nested_value
                 )
 
                 # Concatenate the nested values to the file path
-                file_path /= Path(nested_values)
+                path_parts.append(nested_values)
             else:
                 # Ensure value is a string representation
                 value_str = str(value)
@@ -92,27 +90,24 @@ def create_filepath_from_keys(
                     value_str = "sID" + value_str
 
                 # Concatenate value to the file path
-                file_path /= Path(value_str)
+                path_parts.append(value_str)
 
             # Insert the chosen value after 'experimentName'
             if key == "sampleID" and chosen_value is not None:
-                file_path /= Path(chosen_value)
+                path_parts.append(chosen_value)
         elif key == "influence":
             continue
         else:
             st.error(f"Key '{key}' not found in input_dict.")
             raise KeyError(f"Key '{key}' not found in input_dict.")
 
-    return file_path
+    return Path(*path_parts)
 
 
 @pytest.fixture
-def input_dict():
-    # load from resources file
-    with open("backend/tests/resources/template_base.json", "r") as f:
-        base_metadata = json.load(f)
-
-    return base_metadata
+def input_dict(base_metadata):
+    # tests only replace top-level keys, so a shallow copy is sufficient
+    return copy.copy(base_metadata)
 
 
 # ORDER
@@ -0,0 +1,96 @@
+import pytest
+from fastapi import FastAPI
+
+# TestClient needs httpx, which is not part of the backend requirements
+pytest.importorskip("httpx")
+
+
+@pytest.fixture
+def client(db, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    monkeypatch.setenv("DATABASE_BACKEND", "sqlite")
+    # imported after db has pointed the sqlite module at the temporary file
+    from router import biofiles
+
+    monkeypatch.setattr(biofiles, "DB", db)
+    app = FastAPI()
+    app.include_router(biofiles.router, prefix="/biofiles")
+    return TestClient(app)
+
+
+def search(client, params=None, body=None):
+    return client.post("/biofiles/search", params=params, json=body or {})
+
+
+def filepaths(response):
+    return [biofile["filepath"] for biofile in response.json()]
+
+
+def test_search_without_paging(client, biofiles):
+    response = search(client)
+
+    assert response.status_code == 200
+    assert response.headers["X-Total-Count"] == str(len(biofiles))
+    assert filepaths(response) == [row["filepath"] for row in biofiles]
+
+
+def test_search_limit(client, biofiles):
+    response = search(client, params={"limit": 10})
+
+    assert response.status_code == 200
+    assert response.headers["X-Total-Count"] == str(len(biofiles))
+    assert filepaths(response) == [row["filepath"] for row in biofiles[:10]]
+
+
+def test_search_limit_and_offset(client, biofiles):
+    response = search(client, params={"limit": 10, "offset": 20})
+
+    assert response.status_code == 200
+    assert response.headers["X-Total-Count"] == str(len(biofiles))
+    assert filepaths(response) == [row["filepath"] for row in biofiles[20:30]]
+
+
+def test_search_offset(client, biofiles):
+    response = search(client, params={"offset": 50})
+
+    assert response.status_code == 200
+    assert response.headers["X-Total-Count"] == str(len(biofiles))
+    assert filepaths(response) == [row["filepath"] for row in biofiles[50:]]
+
+
+@pytest.mark.parametrize("params", [{"offset": 1000}, {"limit": 10, "offset": 1000}])
+def test_search_past_the_end(client, biofiles, params):
+    response = search(client, params=params)
+
+    assert response.status_code == 200
+    assert response.headers["X-Total-Count"] == str(len(biofiles))
+    assert response.json() == []
+
+
+def test_search_filter(client, biofiles):
+    response = search(client, params={"limit": 100}, body={"experimenter": ["JDoe"]})
+
+    expected = [
+        row["filepath"]
+        for row in biofiles
+        if "JDoe" in row["filecontext"]["experimenter"]
+    ]
+    assert response.status_code == 200
+    assert response.headers["X-Total-Count"] == str(len(expected))
+    assert filepaths(response) == expected
+
+
+@pytest.mark.parametrize("params", [None, {"limit": 10}, {"offset": 5}])
+def test_search_no_match(client, params):
+    response = search(client, params=params, body={"experimenter": ["Nobody"]})
+
+    assert response.status_code == 404
+    assert "X-Total-Count" not in response.headers
+
+
+@pytest.mark.parametrize("params", [{"limit": 0}, {"offset": -1}])
+def test_search_invalid_paging(client, params):
+    response = search(client, params=params)
+
+    assert response.status_code == 422
@@ -0,0 +1,99 @@
+import asyncio
+from collections import Counter, defaultdict
+
+import pytest
+from model.search import SearchModel
+
+
+def test_stats_totals(db, biofiles):
+    stats = asyncio.run(db.retrieve_biofile_stats())
+
+    assert stats["total_count"] == len(biofiles)
+    assert stats["total_size"] == sum(row["filesize"] for row in biofiles)
+
+
+def test_stats_filesize_per_date(db, biofiles):
+    stats = asyncio.run(db.retrieve_biofile_stats())
+
+    sizes = defaultdict(list)
+    for row in biofiles:
+        sizes[row["filecontext"]["date"]].append(row["filesize"])
+
+    assert [row["date"] for row in stats["date"]] == sorted(sizes)
+    for row in stats["date"]:
+        date_sizes = sizes[row["date"]]
+        assert row["count"] == len(date_sizes)
+        assert row["filesize_sum"] == sum(date_sizes)
+        assert row["filesize_mean"] == pytest.approx(sum(date_sizes) / len(date_sizes))
+
+
+def test_stats_counts(db, biofiles):
+    stats = asyncio.run(db.retrieve_biofile_stats())
+
+    # every experimenter of a file is counted once
+    experimenters = Counter(
+        name for row in biofiles for name in row["filecontext"]["experimenter"]
+    )
+    assert {row["experimenter"]: row["count"] for row in stats["experimenter"]} == (
+        experimenters
+    )
+    counts = [row["count"] for row in stats["experimenter"]]
+    assert counts == sorted(counts, reverse=True)
+
+    species = Counter(row["filecontext"]["species"] for row in biofiles)
+    assert {row["species"]: row["count"] for row in stats["species"]} == species
+
+    upload_days = Counter(row["filecontext"]["creationDate"][:10] for row in biofiles)
+    assert {row["creationDate"]: row["count"] for row in stats["creationDate"]} == (
+        upload_days
+    )
+
+    assert sum(row["filesize"] for row in stats["subject"]) == stats["total_size"]
+
+
+@pytest.mark.parametrize(
+    "search, matches",
+    [
+        ({}, lambda filecontext: True),
+        ({"species": ["Rat"]}, lambda filecontext: filecontext["species"] == "Rat"),
+        (
+            {"experimenter": ["JDoe"]},
+            lambda filecontext: "JDoe" in filecontext["experimenter"],
+        ),
+        ({"experimenter": ["Nobody"]}, lambda filecontext: False),
+    ],
+)
+def test_count_by_search(db, biofiles, search, matches):
+    count = asyncio.run(db.count_biofiles_by_search(SearchModel(**search)))
+
+    assert count == sum(matches(row["filecontext"]) for row in biofiles)
+
+
+@pytest.mark.parametrize("limit", [1, 10, 25, 100])
+def test_search_pages_cover_all_matches(db, limit):
+    search = SearchModel(experimenter=["ADau"])
+
+    async def fetch_pages():
+        total = await db.count_biofiles_by_search(search)
+        unpaged = await db.retrieve_biofiles_by_search(search)
+        pages = [
+            await db.retrieve_biofiles_by_search(search, limit, offset)
+            for offset in range(0, total, limit)
+        ]
+        return total, unpaged, pages
+
+    total, unpaged, pages = asyncio.run(fetch_pages())
+
+    assert all(len(page) <= limit for page in pages)
+    paged_ids = [biofile["_id"] for page in pages for biofile in page]
+    # no duplicates or gaps between consecutive pages
+    assert len(paged_ids) == total
+    assert paged_ids == sorted({biofile["_id"] for biofile in unpaged})
+
+
+def test_search_offset_without_limit(db, biofiles):
+    search = SearchModel()
+
+    results = asyncio.run(db.retrieve_biofiles_by_search(search, offset=50))
+
+    assert [biofile["_id"] for biofile in results] == list(range(51, len(biofiles) + 1))
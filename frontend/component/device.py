@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 import streamlit as st
 from core.utils import (
@@ -15,6 +15,17 @@ from core.utils import (
     MICROSCOPE_TASKS,
 )
 
+# Mutually exclusive keys of the labDevice and microscope task dicts
+LAB_DEVICE_KEYS = ("microscope", "mea")
+MICROSCOPE_TASK_KEYS = ("brightfield", "ca2Imaging", "ifStaining")
+
+
+def _retain_only(data: Dict[str, Any], keep: str, keys: Tuple[str, ...]) -> None:
+    """Remove the deselected options in keys (all but keep) from data."""
+    for key in keys:
+        if key != keep:
+            data.pop(key, None)
+
 
 def session_device_component(experiment_data: Dict[str, Any]):
     experiment_data["labDeviceType"] = st.radio(
@@ -31,10 +42,10 @@ def session_device_component(experiment_data: Dict[str, Any]):
     match experiment_data["labDeviceType"]:
         case "Microscope":
             microscope_device_component(experiment_data)
-            experiment_data["labDevice"].pop("mea", None)
+            _retain_only(experiment_data["labDevice"], "microscope", LAB_DEVICE_KEYS)
         case "MEA":
             mea_device_component(experiment_data)
-            experiment_data["labDevice"].pop("microscope", None)
+            _retain_only(experiment_data["labDevice"], "mea", LAB_DEVICE_KEYS)
 
 
 def microscope_device_component(experiment_data):
@@ -76,8 +87,7 @@ def microscope_device_component(experiment_data):
             else:
                 case_dict = device_dict["brightfield"]
 
-            device_dict.pop("ca2Imaging", None)
-            device_dict.pop("ifStaining", None)
+            _retain_only(device_dict, "brightfield", MICROSCOPE_TASK_KEYS)
 
             # Components
 
@@ -88,8 +98,7 @@ def microscope_device_component(experiment_data):
             else:
                 case_dict = device_dict["ca2Imaging"]
 
-            device_dict.pop("brightfield", None)
-            device_dict.pop("ifStaining", None)
+            _retain_only(device_dict, "ca2Imaging", MICROSCOPE_TASK_KEYS)
 
             # Components
             case_dict["dye"] = st.selectbox(
@@ -102,8 +111,7 @@ def microscope_device_component(experiment_data):
         case "IF-staining":
             if_staining_component(device_dict)
 
-            device_dict.pop("brightfield", None)
-            device_dict.pop("ca2Imaging", None)
+            _retain_only(device_dict, "ifStaining", MICROSCOPE_TASK_KEYS)
 
 
 def if_staining_component(device_dict):
@@ -122,11 +130,9 @@ def if_staining_component(device_dict):
         step=1,
     )
 
-    # Initialize containers dynamically
-    containers = [st.container() for _ in range(case_dict.get("numAntibodies", 0))]
-
-    # Use the containers as needed
-    for index, container in enumerate(containers, start=1):
+    # Create one container per antibody while rendering it
+    for index in range(1, case_dict.get("numAntibodies", 0) + 1):
+        container = st.container()
         container.write(f":red[ANTIBODY {index}]")
         col_container = container.columns(2)
         case_dict[f"abPrim{index}"] = col_container[0].selectbox(
@@ -163,8 +169,6 @@ def mea_device_component(experiment_data):
     else:
         case_dict = experiment_data["labDevice"]["mea"]
 
-    case_dict["type"] = "mea"
-
     case_dict["type"] = "MEA"
 
     case_dict["name"] = st.selectbox(
@@ -5,16 +5,10 @@ import streamlit as st
 from core.utils import get_request
 
 
-def sticky_file_component(search_path: str = "upload") -> Optional[Path]:
-    header = st.container()
-    header_con = header.empty()
-
-    # Custom CSS for the sticky header
-    # BUG: Currently dark theme is not supported for automatic switching
-    # see: https://discuss.streamlit.io/t/check-if-the-app-is-in-dark-mode-or-light-mode-at-runtime/20222/3
-    header.write("""<div class='fixed-header'/>""", unsafe_allow_html=True)
-    st.markdown(
-        """
+# Custom CSS for the sticky header
+# BUG: Currently dark theme is not supported for automatic switching
+# see: https://discuss.streamlit.io/t/check-if-the-app-is-in-dark-mode-or-light-mode-at-runtime/20222/3
+STICKY_HEADER_CSS = """
     <style>
         div[data-testid="stVerticalBlock"] div:has(div.fixed-header) {
             position: sticky;
@@ -22,16 +16,20 @@ def sticky_file_component(search_path: str = "upload") -> Optional[Path]:
             background-color: white;
             z-index: 999;
         }
-    
+
         .fixed-header {
             border-bottom: 1.5px solid red;
         }
-
-        */
     </style>
-        """,
-        unsafe_allow_html=True,
-    )
+"""
+
+
+def sticky_file_component(search_path: str = "upload") -> Optional[Path]:
+    header = st.container()
+    header_con = header.empty()
+
+    header.write("""<div class='fixed-header'/>""", unsafe_allow_html=True)
+    st.markdown(STICKY_HEADER_CSS, unsafe_allow_html=True)
 
     # Get the list of files in the upload folder
     result_filelist = get_request("filemanagement", "filelist", "upload")
@@ -1,6 +1,6 @@
 from datetime import datetime
 import json
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 from pathlib import Path
 import streamlit as st
 from core.utils import (
@@ -30,6 +30,80 @@ from core.utils import (
 data_path = Path("data")
 upload_path = Path("upload")
 
+# Keys of experiment_data used by the backend to calculate the experiment path
+FILEPATH_KEYS = (
+    "species",
+    "origin",
+    "organType",
+    "cellType",
+    "brainRegion",
+    "experimentName",
+    "sampleID",
+    "ageDIV",
+    "ageDAP",
+    "influenceGroups",
+    "labDevice",
+)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _compute_filepath(
+    filepath_data: str, key_order: Optional[Tuple[str, ...]] = None
+) -> Tuple[int, Dict[str, Any]]:
+    """Request the experiment path for the JSON encoded filepath data.
+
+    The result is cached on the serialized data so reruns with unchanged
+    inputs skip the request to the backend.
+    """
+    data = {"experiment_data": json.loads(filepath_data)}
+    if key_order is not None:
+        data["key_order"] = list(key_order)
+    response = post_request("biofiles", "filepath", data=data)
+    return response.status_code, response.json()
+
+
+@st.cache_data(ttl=10, show_spinner=False)
+def _list_existing_folders(path: str) -> List[str]:
+    """List the folders at path, or an empty list if it does not exist yet."""
+    response = get_request("filemanagement", "exists", path)
+    if response.status_code == 200:
+        return get_request("filemanagement", "list", path).json()["data"]
+    return []
+
+
+@st.cache_data(show_spinner="Calculating hash...")
+def _cached_hash_calc(filename: str, filesize: int, mtime_ns: int) -> str:
+    """Retrieve the hash of an uploaded file.
+
+    filesize and mtime_ns are only part of the cache key, so the hash is
+    requested again once the file in the upload folder changes.
+    """
+    return get_hash_calc(filename)
+
+
+def _file_signature(path: Path) -> Tuple[int, int]:
+    """Return size and modification time of path or (-1, -1) if it is missing."""
+    try:
+        file_stat = path.stat()
+    except FileNotFoundError:
+        return -1, -1
+    return file_stat.st_size, file_stat.st_mtime_ns
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _prefill_list(options: Tuple[str, ...]) -> PrefillList:
+    """Return a shared PrefillList for the given options."""
+    return PrefillList(options)
+
+
+def _filepath_data(experiment_data: Dict[str, Any]) -> str:
+    """Serialize the part of experiment_data relevant for the experiment path."""
+    return json.dumps(
+        {key: experiment_data[key] for key in FILEPATH_KEYS if key in experiment_data},
+        sort_keys=True,
+        cls=DateTimeEncoder,
+    )
+
 
 def subject_specification_component(experiment_data: Dict[str, Any]):
     experiment_data["species"] = st.radio(
@@ -106,8 +180,8 @@ def subject_meta_protocol_cellid_component(experiment_data: Dict[str, Any]):
         options=PROTOCOLS.keys(),
         default=PROTOCOLS.getlistdefault("protocolNames", experiment_data),
         help=(
-            "Each time you run this, protocols are freshly loaded "
-            "from the path specified in the 'labdata.yml' file."
+            "Protocols are loaded from the path specified in the "
+            "'labdata.yml' file and cached for up to one minute."
         ),
     )
 
@@ -181,22 +255,21 @@ def session_metadata_component(experiment_data: Dict[str, Any]):
     )
 
     # Create and check for experimentName
-    response = post_request(
-        "biofiles",
-        "filepath",
-        data={
-            "experiment_data": json.loads(
-                json.dumps(experiment_data, cls=DateTimeEncoder)
-            ),
-            "key_order": ["species", "origin", "organType", "cellType"],
-        },
+    status_code, response_data = _compute_filepath(
+        _filepath_data(experiment_data),
+        key_order=("species", "origin", "organType", "cellType"),
     )
-    if response.status_code != 200:
-        st.error(f"Error: {response.json()['detail']}")
+    if status_code != 200:
+        st.error(f"Error: {response_data['detail']}")
         st.stop()
-    filepath_so_far = Path(response.json()["data"]["experiment_path"])
+    filepath_so_far = Path(response_data["data"]["experiment_path"])
 
-    st.write(f"The filepath so far: :red[**{filepath_so_far}**]")
+    col_filepath1, col_filepath2 = st.columns([4, 1])
+    col_filepath1.write(f"The filepath so far: :red[**{filepath_so_far}**]")
+    if col_filepath2.button(
+        "Refresh folders", help="Reload the existing experiment folders."
+    ):
+        _list_existing_folders.clear()
 
     experimenters = "-".join(experiment_data["experimenter"])
     keywords = "-".join(experiment_data["keywords"][:3])
@@ -204,21 +277,13 @@ def session_metadata_component(experiment_data: Dict[str, Any]):
         ["exp", str(experiment_data["date"]), experimenters, keywords]
     )
 
-    response = get_request(
-        "filemanagement", "exists", (data_path / filepath_so_far).as_posix()
-    )
-    if response.status_code == 200:
-        existing_folders = get_request(
-            "filemanagement", "list", (data_path / filepath_so_far).as_posix()
-        ).json()["data"]
-    else:
-        existing_folders = []
+    existing_folders = _list_existing_folders((data_path / filepath_so_far).as_posix())
 
-    available_experimentNames = set(existing_folders + [new_experiment_name])
+    available_experimentNames = tuple({*existing_folders, new_experiment_name})
     selected_folder = st.selectbox(
         "Select experiment folder and define **'experimentName'**: \n\n :blue[exp_<date-of-first-measurement>_ <experimenter(s)>_<keyword(s)>]",
         options=available_experimentNames,
-        index=PrefillList(available_experimentNames).getindexdefault(
+        index=_prefill_list(available_experimentNames).getindexdefault(
             "experimentName", experiment_data
         ),
     )
@@ -233,7 +298,7 @@ def session_metadata_component(experiment_data: Dict[str, Any]):
     experiment_data["precursorExperimentNames"] = st.multiselect(
         "Precursor experiment(s)",
         options=existing_folders,
-        default=PrefillList(existing_folders).getlistdefault(
+        default=_prefill_list(tuple(existing_folders)).getlistdefault(
             "precursorExperimentNames", experiment_data
         ),
         help="Select precursor experiment(s) to link the current experiment to them.",
@@ -298,19 +363,11 @@ def output_filepath_component(experiment_data: Dict[str, Any], filename):
     st.write(
         "The following path will be used to save the file. The template is given in blue while the actual path is given in red:"
     )
-    response = post_request(
-        "biofiles",
-        "filepath",
-        data={
-            "experiment_data": json.loads(
-                json.dumps(experiment_data, cls=DateTimeEncoder)
-            )
-        },
-    )
-    if response.status_code != 200:
-        st.error(f"Error: {response.json()['detail']}")
+    status_code, response_data = _compute_filepath(_filepath_data(experiment_data))
+    if status_code != 200:
+        st.error(f"Error: {response_data['detail']}")
         st.stop()
-    experiment_path = Path(response.json()["data"]["experiment_path"])
+    experiment_path = Path(response_data["data"]["experiment_path"])
 
     complete_filepath: Path = data_path / experiment_path / filename
 
@@ -376,15 +433,14 @@ def output_check_component(
     if check_existence_of_filepath(complete_filepath):
         st.warning("Caution: The filepath already exists in the database.", icon="⚠️")
 
-    with st.spinner("Calculating hash..."):
-        hash_info = get_hash_calc(filename)
+    # the upload folder is shared with the backend, the local stat gives the same size
+    filesize_info, mtime_ns = _file_signature(upload_path / filename)
+    if filesize_info < 0:
+        st.error("Error retrieving file size.")
+        # without the file there is nothing to hash or submit
+        st.stop()
 
-    response = get_request("filemanagement", "filesize", upload_path / filename)
-    match response.status_code:
-        case 200:
-            filesize_info = response.json()["data"]["size"]
-        case _:
-            st.error("Error retrieving file size.")
+    hash_info = _cached_hash_calc(filename.as_posix(), filesize_info, mtime_ns)
 
     filehash_exists, filepaths_for_hash = get_file_paths_of_existing_hash(hash_info)
 
@@ -423,12 +479,12 @@ def output_submit_component(
                         "filename": filename.as_posix(),
                         "srcpath": upload_path.as_posix(),
                         "dstpath": complete_filepath.parent.as_posix(),
-                        "filecontext": json.loads(
-                            json.dumps(experiment_data, cls=DateTimeEncoder)
-                        ),
+                        "filecontext": experiment_data,
                     },
                 )
                 if response.status_code == 200:
+                    # The move may have created a new experiment folder
+                    _list_existing_folders.clear()
                     st.success(
                         f"File **{filename}** moved and metadata file created sucessfully."
                     )
@@ -13,11 +13,22 @@ from core.utils import (
     WELLS,
 )
 
+INFLUENCE_TITLES = tuple(i.title() for i in INFLUENCE)
+INFLUENCE_RANK = {i.lower(): rank for rank, i in enumerate(INFLUENCE)}
+
+
+def _get_or_create_dict(data: Dict[str, Any], key: str) -> Dict[str, Any]:
+    """Return data[key], replacing a missing or None entry with an empty dict."""
+    value = data.get(key)
+    if value is None:
+        value = data[key] = {}
+    return value
+
 
 def influence_specification_component(experiment_data: Dict[str, Any], key):
     influence_options = st.multiselect(
         "Influence",
-        options=[i.title() for i in INFLUENCE],
+        options=INFLUENCE_TITLES,
         label_visibility="collapsed",
         default=[
             i.title()
@@ -26,13 +37,10 @@ def influence_specification_component(experiment_data: Dict[str, Any], key):
         key=key,
     )
 
-    if experiment_data["influenceGroups"].get(key) is None:
-        influence_group_dict = experiment_data["influenceGroups"][key] = {}
-    else:
-        influence_group_dict = experiment_data["influenceGroups"][key]
+    influence_group_dict = _get_or_create_dict(experiment_data["influenceGroups"], key)
 
     for influence_option in sorted(
-        influence_options, key=lambda x: INFLUENCE.index(x.lower())
+        influence_options, key=lambda x: INFLUENCE_RANK[x.lower()]
     ):
         match influence_option:
             case "Control":
@@ -53,11 +61,9 @@ def influence_specification_component(experiment_data: Dict[str, Any], key):
                 influence_disease_component(influence_group_dict, key=key)
 
     # Remove influence options that are not selected anymore
-    for option in INFLUENCE:
-        if option.title() not in influence_options:
-            influence_group_dict.pop(
-                option.lower(), None
-            )  # influence_options are .title()ed
+    selected_names = {x.lower() for x in influence_options}  # options are .title()ed
+    for name in (INFLUENCE_RANK.keys() - selected_names) & influence_group_dict.keys():
+        del influence_group_dict[name]
 
     # write the influence data to the experiment_data dict
     experiment_data["influenceGroups"][key] = influence_group_dict
@@ -84,8 +90,7 @@ def influence_meta_specification_component(experiment_data: Dict[str, Any]):
             for i in range(1, experiment_data["numInfluenceGroups"] + 1)
         ]
     )
-    if experiment_data.get("influenceGroups") is None:
-        experiment_data["influenceGroups"] = {}
+    _get_or_create_dict(experiment_data, "influenceGroups")
     for index, influence_tab in enumerate(influence_tabs, start=1):
         with influence_tab:
             influence_specification_component(
@@ -103,10 +108,7 @@ def influence_control_component(influence_data, influence_options, key):
             "Pay attention to the influences chosen.",
             icon="⚠️",
         )
-    if influence_data.get("control") is None:
-        case_dict = influence_data["control"] = {}
-    else:
-        case_dict = influence_data["control"]
+    case_dict = _get_or_create_dict(influence_data, "control")
 
     case_dict["name"] = "Control"
 
@@ -130,10 +132,7 @@ def influence_sham_component(influence_data, influence_options, key):
             icon="⚠️",
         )
 
-    if influence_data.get("sham") is None:
-        case_dict = influence_data["sham"] = {}
-    else:
-        case_dict = influence_data["sham"]
+    case_dict = _get_or_create_dict(influence_data, "sham")
 
     case_dict["name"] = "Sham"
 
@@ -157,10 +156,7 @@ def influence_radiation_component(influence_data, key):
     con_radiation.write("###### :red[Radiation]")
 
     # If influence is not yet defined in the template, create a new dict
-    if influence_data.get("radiation") is None:
-        case_dict = influence_data["radiation"] = {}
-    else:
-        case_dict = influence_data["radiation"]
+    case_dict = _get_or_create_dict(influence_data, "radiation")
     # st.write(experiment_data)
     case_dict["name"] = con_radiation.selectbox(
         "Name",
@@ -233,10 +229,7 @@ def influence_pharmacology_component(influence_data, key):
     con_pharmacology.write("###### :red[Pharmacology]")
 
     # If influence is not yet defined in the template, create a new dict
-    if influence_data.get("pharmacology") is None:
-        case_dict = influence_data["pharmacology"] = {}
-    else:
-        case_dict = influence_data["pharmacology"]
+    case_dict = _get_or_create_dict(influence_data, "pharmacology")
 
     # Components
     case_dict["name"] = con_pharmacology.selectbox(
@@ -302,10 +295,7 @@ def influence_stimulus_component(influence_data, key):
     con_stimulus = st.container()
 
     con_stimulus.write("###### :red[Stimulus]")
-    if influence_data.get("stimulus") is None:
-        case_dict = influence_data["stimulus"] = {}
-    else:
-        case_dict = influence_data["stimulus"]
+    case_dict = _get_or_create_dict(influence_data, "stimulus")
 
     case_dict["name"] = "Stimulus"
 
@@ -320,10 +310,7 @@ def influence_disease_component(influence_data, key):
     con_disease.write("###### :red[Disease]")
 
     # If influence is not yet defined in the template, create a new dict
-    if influence_data.get("disease") is None:
-        case_dict = influence_data["disease"] = {}
-    else:
-        case_dict = influence_data["disease"]
+    case_dict = _get_or_create_dict(influence_data, "disease")
 
     # Components
     case_dict["name"] = con_disease.selectbox(
@@ -1,4 +1,5 @@
 from datetime import date
+from itertools import chain
 
 import streamlit as st
 from core.utils import (
@@ -21,6 +22,9 @@ from core.utils import (
     STIMULUS,
 )
 
+CELL_TYPE_OPTIONS = tuple(chain.from_iterable(CELL_TYPE.values()))
+SEARCH_MIN_DATE = date(2000, 1, 1)
+
 # import streamlit_antd_components as sac
 # from streamlit_extras.stylable_container import stylable_container
 
@@ -65,7 +69,7 @@ def subject_row(search_data, col_args):
     )
 
     search_data["cellType"] = row_cols[3].multiselect(
-        "Cell type", options=sum(CELL_TYPE.values(), [])
+        "Cell type", options=CELL_TYPE_OPTIONS
     )
 
     search_data["brainRegion"] = row_cols[4].multiselect(
@@ -90,11 +94,12 @@ def session_general_row(search_data, col_args):
 
     search_data["lab"] = row_cols[2].multiselect("Laboratory", options=LABS)
 
+    today = date.today()
     search_data["date_from"], search_data["date_to"] = row_cols[3].slider(
         "Experiment Date",
-        min_value=date(2000, 1, 1),
-        max_value=date.today(),
-        value=(date(2000, 1, 1), date.today()),
+        min_value=SEARCH_MIN_DATE,
+        max_value=today,
+        value=(SEARCH_MIN_DATE, today),
         format="DD.MM.YYYY",
     )
 
@@ -12,10 +12,9 @@ def sidebar_upload_component() -> Optional[Dict[str, Any]]:
     st.sidebar.subheader(":black[Select template]")
     uploaded_file = st.sidebar.file_uploader("Import template data.", type=["json"])
     if uploaded_file is not None:
-        file_content = uploaded_file.read()
         try:
             # Parse the JSON content
-            json_data = json.loads(file_content, cls=DateTimeDecoder)
+            json_data = json.load(uploaded_file, cls=DateTimeDecoder)
             st.success("Template data imported successfully!")
             return json_data
         except json.JSONDecodeError:
@@ -39,12 +38,11 @@ def sidebar_download_component(json_data: Dict[str, Any]):
     )
 
 
-def sidebar_logo_component():
-    logo_url = "static/CellRex_Swoosh.svg"
+@st.cache_data(show_spinner=False)
+def _logo_css(logo_url: str) -> str:
     logo = f"url(data:image/svg+xml;base64,{base64.b64encode(Path(logo_url).read_bytes()).decode()})"
 
-    st.markdown(
-        f"""
+    return f"""
     <style>
         [data-testid="stSidebarNav"] {{
             background-image: {logo};
@@ -53,6 +51,8 @@ def sidebar_logo_component():
             background-position: 20px 40px;
         }}
     </style>
-    """,
-        unsafe_allow_html=True,
-    )
+    """
+
+
+def sidebar_logo_component():
+    st.markdown(_logo_css("static/CellRex_Swoosh.svg"), unsafe_allow_html=True)
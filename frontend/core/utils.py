@@ -1,23 +1,33 @@
 import json
 import time
 
+import pandas as pd
+import pyarrow as pa
 import requests
 import streamlit as st
-from core.utils_json import DateTimeEncoder
-from typing import Optional
+from core.utils_http import get_session, is_success, response_json
+from core.utils_json import DateTimeEncoder, flatten_records
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+try:
+    from streamlit.type_util import fix_arrow_incompatible_column_types
+except ImportError:  # internal helper of Streamlit, not present in every release
+    fix_arrow_incompatible_column_types = None
 
 from core.utils_yml import parse_labdata
 
 
 BASE_URL = "http://backend:8000"
+HASH_POLL_ATTEMPTS = 60  # about seven minutes with the backoff capped at 8 s
 
 
+@st.cache_data(ttl=60, show_spinner=False)
 def read_protocol_file(protocol_file):
     url = f"{BASE_URL}/{protocol_file}"
 
-    response = requests.get(url)
+    response = get_session().get(url)
 
-    if response.status_code == 200:
+    if is_success(response):
         protocol = response.text
     else:
         raise FileNotFoundError(f"File {protocol_file} not found.")
@@ -31,50 +41,154 @@ def read_protocol_file(protocol_file):
 
 def get_request(
     route: str, endpoint: str, parameter: Optional[str] = None, timeout: int = 10
-) -> dict:
+) -> requests.Response:
     url = f"{BASE_URL}/{route}/{endpoint}"
     if parameter:
         url += f"/{parameter}"
-    response = requests.get(url, timeout=timeout)
+    response = get_session().get(url, timeout=timeout)
     return response
 
 
-def post_request(route: str, endpoint: str, data: dict, timeout: int = 10) -> dict:
-    response = requests.post(
+def post_request(
+    route: str,
+    endpoint: str,
+    data: dict,
+    timeout: int = 10,
+    params: Optional[dict] = None,
+) -> requests.Response:
+    # serialize once, dates and times are encoded as ISO strings
+    response = get_session().post(
         f"{BASE_URL}/{route}/{endpoint}",
-        json=data,
+        data=json.dumps(data, cls=DateTimeEncoder).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+        params=params,
         timeout=timeout,
     )
     return response
 
 
+@st.cache_data(show_spinner=False)
 def get_labdata():
     url = f"{BASE_URL}/config/labdata.yml"
     dummy_url = f"{BASE_URL}/static/labdata_dummy.yml"
 
-    response = requests.get(url)
-
-    if response.status_code == 200:
-        labdata = parse_labdata(url)
-    else:
-        labdata = parse_labdata(dummy_url)
+    # Request the lab specific file only once, fall back to the dummy if it is missing
+    labdata = parse_labdata(url) or parse_labdata(dummy_url)
 
     # TODO: Add type hinting for yaml files:
     # https://stackoverflow.com/questions/61483082/what-is-the-proper-way-to-add-type-hints-after-loading-a-yaml-file
     # Maybe add pydantic or dataclasses for these variables?
 
-    # Create variables programmatically
-    for key, value in labdata.items():
-        globals()[key] = value
+    return labdata
+
+
+# Load labdata from backend for import into frontend
+LABDATA = get_labdata()
+
+ORGAN_TYPE = LABDATA["ORGAN_TYPE"]
+CELL_TYPE = LABDATA["CELL_TYPE"]
+MULTI_CELL_TYPES = LABDATA["MULTI_CELL_TYPES"]
+DEVICES = LABDATA["DEVICES"]
+INFLUENCE = LABDATA["INFLUENCE"]
+MICROSCOPE_TASKS = LABDATA["MICROSCOPE_TASKS"]
+KEYWORDS = LABDATA["KEYWORDS"]
+LABS = LABDATA["LABS"]
+EXPERIMENTERS = LABDATA["EXPERIMENTERS"]
+SPECIES = LABDATA["SPECIES"]
+ORIGIN = LABDATA["ORIGIN"]
+BRAIN_REGIONS = LABDATA["BRAIN_REGIONS"]
+PROTOCOLS = LABDATA["PROTOCOLS"]
+DISEASE = LABDATA["DISEASE"]
+DRUG = LABDATA["DRUG"]
+DRUG_UNIT = LABDATA["DRUG_UNIT"]
+TIME_UNIT = LABDATA["TIME_UNIT"]
+RADIATION = LABDATA["RADIATION"]
+RADIATION_UNIT = LABDATA["RADIATION_UNIT"]
+IRRADIATION_DEVICE = LABDATA["IRRADIATION_DEVICE"]
+STIMULUS = LABDATA["STIMULUS"]
+DEVICE_MEA = LABDATA["DEVICE_MEA"]
+DEVICE_MICROSCOPE = LABDATA["DEVICE_MICROSCOPE"]
+MAGNIFICATIONS = LABDATA["MAGNIFICATIONS"]
+MEA_CHIP_TYPE = LABDATA["MEA_CHIP_TYPE"]
+ANTIBODY_PRIMARY = LABDATA["ANTIBODY_PRIMARY"]
+ANTIBODY_SECONDARY = LABDATA["ANTIBODY_SECONDARY"]
+ANTIBODY_CONJUGATED = LABDATA["ANTIBODY_CONJUGATED"]
+DYE_CA2_IMAGING = LABDATA["DYE_CA2_IMAGING"]
+DYE_OTHER = LABDATA["DYE_OTHER"]
+WELLS = LABDATA["WELLS"]
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def search_biofiles(
+    search_json: str, limit: int, offset: int
+) -> Tuple[int, int, List[Dict[str, Any]]]:
+    """Return status code, total count and one page of the matching biofiles.
+
+    The result is cached on the JSON encoded search for up to one minute.
+    """
+    response = post_request(
+        "biofiles",
+        "search",
+        json.loads(search_json),
+        params={"limit": limit, "offset": offset},
+    )
+    if not is_success(response):
+        return response.status_code, 0, []
+    data = response_json(response)
+    return (
+        response.status_code,
+        int(response.headers.get("X-Total-Count", len(data))),
+        data,
+    )
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def search_results_table(
+    search_json: str, limit: int, offset: int, flattening_level: int
+) -> Tuple[Union[pa.Table, pd.DataFrame], List[str]]:
+    """Return one page of search results flattened for st.dataframe and its columns.
+
+    st.dataframe sends Arrow tables to the browser as they are, so the
+    conversion from pandas only runs once per page and flattening level.
+    If the conversion fails, the DataFrame is returned for st.dataframe to fix.
+    """
+    _, _, data = search_biofiles(search_json, limit, offset)
+    df = pd.DataFrame(
+        flatten_records(
+            [row["filecontext"] for row in data], max_level=flattening_level
+        )
+    )
+    columns = list(df.columns)
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False), columns
+    except (pa.ArrowTypeError, pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        # e.g. columns mixing dicts and strings
+        if fix_arrow_incompatible_column_types is None:
+            return df, columns
+        return (
+            pa.Table.from_pandas(
+                fix_arrow_incompatible_column_types(df), preserve_index=False
+            ),
+            columns,
+        )
+
 
+@st.cache_data(ttl=60, show_spinner=False)
+def get_biofile_stats() -> Tuple[int, Dict[str, Any]]:
+    """Return status code and the aggregated statistics of all biofiles.
 
-get_labdata()  # Load labdata from backend for import into frontend
+    The result is cached for up to one minute.
+    """
+    response = get_request("biofiles", "stats", timeout=10)
+    if not is_success(response):
+        return response.status_code, {}
+    return response.status_code, response_json(response)["data"]
 
 
 def get_file_paths_of_existing_hash(hash):
     result = get_request("biofiles", "hash", hash)
     paths = []
-    if result.status_code == 200:
+    if is_success(result):
         paths = [dic["filepath"] for dic in result.json()]
     return (len(paths) > 0), paths
 
@@ -82,14 +196,14 @@ def get_file_paths_of_existing_hash(hash):
 def check_existence_of_filepath(path):
     result = get_request("biofiles", "path", path)
     paths = []
-    if result.status_code != 404:
+    if is_success(result):
         paths = [dic["filepath"] for dic in result.json()]
     return len(paths) > 0
 
 
-def get_hash_calc(filename: str):
-    hash_info = None
-    while hash_info is None:
+def get_hash_calc(filename: str, max_attempts: int = HASH_POLL_ATTEMPTS):
+    # hash is calculated by the backend in the background, back off while waiting
+    for attempt in range(max_attempts):
         response = get_request(
             route="filemanagement", endpoint="hash", parameter=filename
         )
@@ -98,17 +212,27 @@ def get_hash_calc(filename: str):
             case 200:
                 return response.json()["data"]["hash"]
             case 404:
-                time.sleep(2)
+                time.sleep(min(0.25 * 2**attempt, 8))
+            case _:
+                break
 
-    st.empty()  # to break loop on streamlit reload
+    st.error(
+        f"Hash of **{filename}** could not be retrieved. Reload the page to retry."
+    )
+    st.stop()
 
-    return hash_info
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _backend_available():
+    response = get_request("biofiles", "check", "database")
+    return is_success(response)
 
 
 def check_backend():
-    response = get_request("biofiles", "check", "database")
-    if response.status_code == 200:
+    if _backend_available():
         return True
+    # do not keep a failed check, the backend may come up any moment
+    _backend_available.clear()
     return False
 
 
@@ -117,9 +241,7 @@ def create_db_entry(path_to_filename, experiment_data, file_size, file_hash):
         route="biofiles",
         endpoint="",
         data={
-            "filecontext": json.loads(
-                json.dumps(experiment_data, cls=DateTimeEncoder),
-            ),
+            "filecontext": experiment_data,
             "filepath": str(path_to_filename),
             "filesize": file_size,
             "filehash": file_hash,
@@ -128,6 +250,10 @@ def create_db_entry(path_to_filename, experiment_data, file_size, file_hash):
     )
 
     if response.status_code == 201:
+        # show the new entry in search and dashboard right away
+        search_biofiles.clear()
+        search_results_table.clear()
+        get_biofile_stats.clear()
         st.success("Entry created successfully.")
         return True
     else:
@@ -139,9 +265,8 @@ def create_db_entry(path_to_filename, experiment_data, file_size, file_hash):
 
 def create_demo_files(path, num_files=1, file_size_in_bytes=1024):
     # Total filesize fits not perfectly file_size_in_bytes
+    line = b"A" * 80 + b"\n"
     for i in range(1, num_files + 1):
-        filename, first_line = f"demofile{i}.txt", f"Content for file {i}\n"
-        with open((path / filename).as_posix(), "w") as file:
-            file.write(first_line)
-            remaining_size = file_size_in_bytes - len(first_line)
-            file.write("\n".join(["A" * 80] * (remaining_size // 80)) + "\n")
+        filename, first_line = f"demofile{i}.txt", f"Content for file {i}\n".encode()
+        num_lines = (file_size_in_bytes - len(first_line)) // 80
+        (path / filename).write_bytes(first_line + (line * num_lines or b"\n"))
@@ -0,0 +1,42 @@
+"""
+This module contains the HTTP session and response helpers used
+for all requests from the frontend to the backend.
+"""
+
+from typing import Any
+
+import requests
+import streamlit as st
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # fall back to the slower standard library parser
+    from json import loads as json_loads
+
+
+@st.cache_resource(show_spinner=False)
+def get_session() -> requests.Session:
+    """Return a session shared across reruns to keep backend connections alive
+
+    Idempotent requests are retried twice on connection errors.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    )
+    session.mount("http://", adapter)
+    return session
+
+
+def is_success(response: requests.Response) -> bool:
+    """Return True for 2xx responses, unlike response.ok which accepts 3xx"""
+    return 200 <= response.status_code < 300
+
+
+def response_json(response: requests.Response) -> Any:
+    """Parse the response body, faster than response.json() for large payloads"""
+    return json_loads(response.content)
@@ -10,18 +10,56 @@ class DateTimeEncoder(JSONEncoder):
             return o.isoformat()
 
 
+def to_jsonable(obj):
+    """Return a copy of obj with dates and times converted to ISO strings
+
+    Equivalent to a round trip through json.dumps with DateTimeEncoder and
+    json.loads, without serializing to and parsing from a string.
+    """
+    if isinstance(obj, dict):
+        return {key: to_jsonable(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [to_jsonable(value) for value in obj]
+    if isinstance(obj, (datetime.date, datetime.time)):
+        return obj.isoformat()
+    return obj
+
+
+def flatten_records(records, max_level=None, sep="."):
+    """Flatten the nested dicts of each record into sep joined keys
+
+    Produces the same records as pandas.json_normalize(records, max_level)
+    hands to the DataFrame, including the key order, but without pandas'
+    deep copy of every record. Values are shared with the input.
+    """
+
+    def flatten(record, prefix, level):
+        flat = dict(record)
+        for key, value in record.items():
+            name = f"{prefix}{sep}{key}" if level else key
+            if isinstance(value, dict) and (max_level is None or level < max_level):
+                del flat[key]
+                flat.update(flatten(value, name, level + 1))
+            elif level:
+                del flat[key]
+                flat[name] = value
+        return flat
+
+    return [flatten(record, "", 0) for record in records]
+
+
 class DateTimeDecoder(JSONDecoder):
     def __init__(self, *args, **kwargs):
         JSONDecoder.__init__(self, *args, object_hook=self.object_hook, **kwargs)
 
     def object_hook(self, obj):
-        ret = {}
-        for key, value in obj.items():
-            if key in {"date", "creationDate"}:
-                ret[key] = datetime.datetime.fromisoformat(value)
-            elif key == "time":
-                if value is not None:
-                    ret[key] = datetime.time.fromisoformat(value)
+        # convert in place, most objects contain none of these keys
+        for key in ("date", "creationDate"):
+            if key in obj:
+                obj[key] = datetime.datetime.fromisoformat(obj[key])
+        if "time" in obj:
+            if obj["time"] is None:
+                del obj["time"]
             else:
-                ret[key] = value
-        return ret
+                obj["time"] = datetime.time.fromisoformat(obj["time"])
+        return obj
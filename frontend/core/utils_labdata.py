@@ -11,16 +11,23 @@ class PrefillList(list):
     amended from: https://stackoverflow.com/questions/2132718
     """
 
+    def _index_map(self) -> Dict[Any, int]:
+        # built on first lookup, labdata is not modified after loading
+        if "_index" not in self.__dict__:
+            index_map = {}
+            for index, value in enumerate(self):
+                index_map.setdefault(value, index)
+            self._index = index_map
+        return self._index
+
     def getindexdefault(
         self, elem: str, experiment_data: Dict[str, Any], default: int = 0
     ) -> int:
+        if elem not in experiment_data:
+            return 0
         try:
-            return (
-                self.index(experiment_data[elem])
-                if elem in experiment_data.keys()
-                else 0
-            )
-        except ValueError:
+            return self._index_map().get(experiment_data[elem], default)
+        except TypeError:
             return default
 
     def getlistdefault(
@@ -43,23 +50,27 @@ class PrefillDict(dict):
     experiment_data dictionary and the dict itself.
     """
 
+    def _index_map(self) -> Dict[Any, int]:
+        # built on first lookup, labdata is not modified after loading
+        if "_index" not in self.__dict__:
+            self._index = {key: index for index, key in enumerate(self)}
+        return self._index
+
     def getindexdefault(
         self, elem: str, experiment_data: Dict[str, Any], default: int = 0
     ) -> int:
+        if elem not in experiment_data:
+            return 0
         try:
-            return (
-                list(self.keys()).index(experiment_data[elem])
-                if elem in experiment_data.keys()
-                else 0
-            )
-        except ValueError:
+            return self._index_map().get(experiment_data[elem], default)
+        except TypeError:
             return default
 
     def getlistdefault(
         self, elems: str, experiment_data: Dict[str, Any], default: List = None
     ) -> List:
         try:
-            return [elem for elem in experiment_data[elems] if elem in self.keys()]
+            return [elem for elem in experiment_data[elems] if elem in self]
         except KeyError:
             print("KeyError")
             return default if default is not None else []
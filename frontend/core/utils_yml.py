@@ -6,8 +6,13 @@ describing specific data used in the lab.
 from typing import Dict, Union
 
 import yaml
-import requests
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+from core.utils_http import get_session, is_success
 from core.utils_labdata import PrefillDict, PrefillList
 
 
@@ -21,20 +26,25 @@ def custom_dict_constructor(loader, node):
     return PrefillDict(loader.construct_mapping(node, deep=True))
 
 
+class LabdataLoader(SafeLoader):
+    """Safe YAML loader constructing PrefillList and PrefillDict objects"""
+
+
+# Add the custom constructors to the YAML loader
+LabdataLoader.add_constructor("tag:yaml.org,2002:seq", custom_list_constructor)
+LabdataLoader.add_constructor("tag:yaml.org,2002:map", custom_dict_constructor)
+
+
 def parse_labdata(
     labdata_file: str,
 ) -> Dict[str, Union[PrefillDict, PrefillList]]:
-    # Add the custom constructor to the YAML loader
-    yaml.SafeLoader.add_constructor("tag:yaml.org,2002:seq", custom_list_constructor)
-    yaml.SafeLoader.add_constructor("tag:yaml.org,2002:map", custom_dict_constructor)
-
     # Get the YAML file from the server
-    response = requests.get(labdata_file)
+    response = get_session().get(labdata_file, timeout=10)
 
     # Check if the request was successful
-    if response.status_code == 200:
+    if is_success(response):
         try:
-            data = yaml.safe_load(response.text)
+            data = yaml.load(response.content, Loader=LabdataLoader)
         except yaml.YAMLError as exc:
             raise ValueError(f"Failed to parse {labdata_file}: {exc}")
     else:
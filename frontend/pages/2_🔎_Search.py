@@ -6,14 +6,16 @@ You can select multiple options for each category.
 """
 
 import json
+import math
 
-import pandas as pd
 import streamlit as st
 from component.search import session_general_row  # make_divider,
 from component.search import device_row, session_influence_row, subject_row
 from component.sidebar import sidebar_logo_component
-from core.utils import check_backend, post_request
-from core.utils_json import DateTimeEncoder
+from core.utils import check_backend, search_biofiles, search_results_table
+from core.utils_json import to_jsonable
+
+PAGE_SIZE = 100
 
 st.set_page_config(page_title="Search", page_icon=":microbe:", layout="wide")
 
@@ -62,46 +64,66 @@ session_influence_row(search_data, col_args=6)
 # make_divider("Device", "cpu-fill")
 device_row(search_data, col_args=6)
 
-search_data = json.loads(json.dumps(search_data, cls=DateTimeEncoder))
+search_data = to_jsonable(search_data)
 
 st.write("## Search Results")
 # st.write(search_data)
 search_data = {k: v for k, v in search_data.items() if v}
 # st.write(search_data)
 
-response = post_request("biofiles", "search", search_data)
-if response.status_code == 200:
-    data = response.json()  # List[BiofileResponse]
-
-    dataframe_columns = st.columns([1 / 12, 11 / 12])
+# Start from the first page whenever the search changes
+search_key = json.dumps(search_data, sort_keys=True)
+if st.session_state.get("search_key") != search_key:
+    st.session_state["search_key"] = search_key
+    st.session_state["search_page"] = 1
+
+offset = (st.session_state.get("search_page", 1) - 1) * PAGE_SIZE
+status_code, total, data = search_biofiles(search_key, PAGE_SIZE, offset)
+if status_code == 200:
+    num_pages = max(1, math.ceil(total / PAGE_SIZE))
+    if st.session_state.get("search_page", 1) > num_pages:
+        # fewer results than before, e.g. files were removed in the meantime
+        st.session_state["search_page"] = num_pages
+        st.rerun()
+
+    dataframe_columns = st.columns([1 / 12, 1 / 12, 10 / 12])
     flattening_level = dataframe_columns[0].number_input(
         "Flattening level", min_value=1, max_value=3, value=3
     )
+    dataframe_columns[1].number_input(
+        f"Page (of {num_pages})",
+        min_value=1,
+        max_value=num_pages,
+        key="search_page",
+        help=f"The results are loaded in pages of {PAGE_SIZE} items.",
+    )
 
-    df = pd.json_normalize(
-        [row["filecontext"] for row in data], max_level=flattening_level
+    table, columns = search_results_table(
+        search_key, PAGE_SIZE, offset, flattening_level
     )
 
-    visible_columns = dataframe_columns[1].multiselect(
-        "Visible columns", options=df.columns
+    visible_columns = dataframe_columns[2].multiselect(
+        "Visible columns", options=columns
     )
     if visible_columns is None:
-        visible_columns = df.columns
+        visible_columns = columns
     st.text(
-        f"Items found: {len(df)}",
+        f"Items found: {total}",
         help="Note that several items (files) may belong to a single measurement.",
     )
-    st.dataframe(df, column_order=visible_columns, use_container_width=True)
+    st.dataframe(table, column_order=visible_columns, use_container_width=True)
 
     with st.expander("Advanced search results", expanded=False):
         st.write(
-            "In the following JSON, you can see the raw search results. "
+            "In the following JSON, you can see the raw search results of this page. "
             "Expand the JSON to see the full results or copy the JSON to "
             "analyze it in a different environment."
         )
         st.json(data, expanded=False)
-elif response.status_code == 404:
+elif status_code == 404:
     st.info("No data found")
 
 else:
-    st.error("Error retrieving data. " + str(response.status_code))
+    # do not keep the failed request in the cache
+    search_biofiles.clear()
+    st.error("Error retrieving data. " + str(status_code))
@@ -11,7 +11,96 @@ import plotly.graph_objs as go
 from plotly.subplots import make_subplots
 
 from component.sidebar import sidebar_logo_component
-from core.utils import check_backend, get_request
+from core.utils import check_backend, get_biofile_stats
+
+# Layout configuration
+P_WIDTH = 350
+P_HEIGHT = 300
+LEGEND = dict(orientation="h", yanchor="bottom", y=1.2, xanchor="center", x=0.5)
+
+
+# The figures only change with the database content, so they are built once per
+# stats result instead of on every rerun. Every upload creates new stats, so only
+# the figures of the latest few results are kept.
+FIGURE_CACHE_ENTRIES = 4
+
+
+@st.cache_data(max_entries=FIGURE_CACHE_ENTRIES, show_spinner=False)
+def activity_figure(date: list, creation_date: list) -> go.Figure:
+    df_date = pd.DataFrame(date, columns=["date", "count"])
+    df_upload = pd.DataFrame(creation_date, columns=["creationDate", "count"])
+
+    fig = make_subplots(specs=[[{"secondary_y": False}]])
+    fig.add_trace(
+        go.Scatter(x=df_date["date"], y=df_date["count"], name="experiment"),
+        secondary_y=False,
+    )
+    fig.add_trace(
+        go.Scatter(x=df_upload["creationDate"], y=df_upload["count"], name="upload"),
+        secondary_y=False,
+    )
+    fig.update_yaxes(title_text="count", secondary_y=False)
+    fig.update_xaxes(title_text="date")
+    fig.update_layout(
+        title_text="Activity", width=P_WIDTH, height=P_HEIGHT, legend=LEGEND
+    )
+    return fig
+
+
+@st.cache_data(max_entries=FIGURE_CACHE_ENTRIES, show_spinner=False)
+def filesize_figure(date: list) -> go.Figure:
+    df_fs = pd.DataFrame(date, columns=["date", "filesize_sum", "filesize_mean"])
+
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    fig.add_trace(
+        go.Scatter(
+            x=df_fs["date"],
+            y=round(df_fs["filesize_sum"] * 1e-9, 2),
+            name="sum",
+        ),
+        secondary_y=False,
+    )
+    fig.add_trace(
+        go.Scatter(
+            x=df_fs["date"],
+            y=round(df_fs["filesize_mean"] * 1e-9, 2),
+            name="mean",
+        ),
+        secondary_y=True,
+    )
+    fig.update_yaxes(title_text="sum", secondary_y=False)
+    fig.update_yaxes(title_text="mean", secondary_y=True)
+    fig.update_xaxes(title_text="date")
+    fig.update_layout(
+        title_text="Filesize", width=P_WIDTH, height=P_HEIGHT, legend=LEGEND
+    )
+    return fig
+
+
+@st.cache_data(max_entries=FIGURE_CACHE_ENTRIES, show_spinner=False)
+def subject_figure(subject: list) -> go.Figure:
+    fig = px.sunburst(
+        pd.DataFrame(subject),
+        path=["species", "origin", "organType", "cellType"],
+        values="filesize",
+    )
+    fig.update_layout(width=P_WIDTH, height=P_HEIGHT)
+    return fig
+
+
+# one entry per count chart and stats result
+@st.cache_data(max_entries=3 * FIGURE_CACHE_ENTRIES, show_spinner=False)
+def count_figure(counts: list, column: str, title: str) -> go.Figure:
+    df_counts = pd.DataFrame(counts, columns=[column, "count"])
+    fig = px.bar(df_counts, x="count", y=column, orientation="h")
+    fig.update_layout(
+        title_text=title,
+        width=P_WIDTH,
+        height=P_HEIGHT,
+        yaxis=dict(title=None, showticklabels=True),
+    )
+    return fig
+
 
 st.set_page_config(page_title="Dashboard", page_icon=":microbe:", layout="wide")
 
@@ -22,23 +111,16 @@ if not check_backend():
 
 st.write("## Dashboard")
 
-response = get_request("biofiles", "all", timeout=10)
-if response.status_code == 200:
-    data = response.json()
-
-    # Layout configuration
-    p_width = 350
-    p_height = 300
+# Aggregations are computed by the database, only the results are transferred
+status_code, stats = get_biofile_stats()
+if status_code == 200:
     gap = "small"
-    legend = dict(orientation="h", yanchor="bottom", y=1.2, xanchor="center", x=0.5)
     theme = "streamlit"
 
-    df_all = pd.json_normalize(row for row in data)
-
     line_1_1, line_1_2, line_1_3 = st.columns(3, gap=gap)
 
     with line_1_1:
-        total_data_count = len(df_all)
+        total_data_count = stats["total_count"]
         st.metric(
             label="Total count",
             value=total_data_count,
@@ -46,120 +128,42 @@ if response.status_code == 200:
         )
 
     with line_1_2:
-        total_data_size = round(df_all["filesize"].sum() * 1e-9, 2)
+        total_data_size = round(stats["total_size"] * 1e-9, 2)
         st.metric(label="Total size", value=f"{total_data_size} GB")
 
-    df = pd.json_normalize([row["filecontext"] for row in data])
-
     line_2_1, line_2_2, line_2_3 = st.columns(3, gap=gap)
 
     with line_2_1:
-        df_date = df["date"]
-        df_date = df_date.value_counts().reset_index().sort_values("date")
-
-        df_upload = df["creationDate"]
-        df_upload = pd.to_datetime(df_upload)
-        df_upload = (
-            df_upload.dt.date.value_counts().reset_index().sort_values("creationDate")
+        st.plotly_chart(
+            activity_figure(stats["date"], stats["creationDate"]), theme=theme
         )
 
-        fig = make_subplots(specs=[[{"secondary_y": False}]])
-        fig.add_trace(
-            go.Scatter(x=df_date["date"], y=df_date["count"], name="experiment"),
-            secondary_y=False,
-        )
-        fig.add_trace(
-            go.Scatter(
-                x=df_upload["creationDate"], y=df_upload["count"], name="upload"
-            ),
-            secondary_y=False,
-        )
-        fig.update_yaxes(title_text="count", secondary_y=False)
-        fig.update_xaxes(title_text="date")
-        fig.update_layout(
-            title_text="Activity", width=p_width, height=p_height, legend=legend
-        )
-        st.plotly_chart(fig, theme=theme)
-
     with line_2_2:
-        df_fs = df
-        df_fs["filesize"] = df_all["filesize"]
-        df_fs_sum = (
-            df_fs.groupby("date")["filesize"].sum().reset_index().sort_values("date")
-        )
-        df_fs_mean = (
-            df_fs.groupby("date")["filesize"].mean().reset_index().sort_values("date")
-        )
-        fig = make_subplots(specs=[[{"secondary_y": True}]])
-        fig.add_trace(
-            go.Scatter(
-                x=df_fs_sum["date"],
-                y=round(df_fs_sum["filesize"] * 1e-9, 2),
-                name="sum",
-            ),
-            secondary_y=False,
-        )
-        fig.add_trace(
-            go.Scatter(
-                x=df_fs_mean["date"],
-                y=round(df_fs_mean["filesize"] * 1e-9, 2),
-                name="mean",
-            ),
-            secondary_y=True,
-        )
-        fig.update_yaxes(title_text="sum", secondary_y=False)
-        fig.update_yaxes(title_text="mean", secondary_y=True)
-        fig.update_xaxes(title_text="date")
-        fig.update_layout(
-            title_text="Filesize", width=p_width, height=p_height, legend=legend
-        )
-        st.plotly_chart(fig, theme=theme)
+        st.plotly_chart(filesize_figure(stats["date"]), theme=theme)
 
     with line_2_3:
-        df_sun = df
-        df_sun["filesize"] = df_all["filesize"]
-        fig = px.sunburst(
-            df_sun,
-            path=["species", "origin", "organType", "cellType"],
-            values="filesize",
-        )
-        fig.update_layout(width=p_width, height=p_height)
-        st.plotly_chart(fig, theme=theme)
+        st.plotly_chart(subject_figure(stats["subject"]), theme=theme)
 
     line_3_1, line_3_2, line_3_3 = st.columns(3, gap=gap)
 
     with line_3_1:
-        df_species = df["species"].value_counts().reset_index()
-        fig = px.bar(df_species, x="count", y="species", orientation="h")
-        fig.update_layout(
-            title_text="Species",
-            width=p_width,
-            height=p_height,
-            yaxis=dict(title=None, showticklabels=True),
+        st.plotly_chart(
+            count_figure(stats["species"], "species", "Species"), theme=theme
         )
-        st.plotly_chart(fig, theme=theme)
 
     with line_3_2:
-        df_experimenter = df["experimenter"].explode().value_counts().reset_index()
-        fig = px.bar(df_experimenter, x="count", y="experimenter", orientation="h")
-        fig.update_layout(
-            title_text="Experimenter",
-            width=p_width,
-            height=p_height,
-            yaxis=dict(title=None, showticklabels=True),
+        st.plotly_chart(
+            count_figure(stats["experimenter"], "experimenter", "Experimenter"),
+            theme=theme,
         )
-        st.plotly_chart(fig, theme=theme)
 
     with line_3_3:
-        df_labDeviceType = df["labDeviceType"].value_counts().reset_index()
-        fig = px.bar(df_labDeviceType, x="count", y="labDeviceType", orientation="h")
-        fig.update_layout(
-            title_text="Device",
-            width=p_width,
-            height=p_height,
-            yaxis=dict(title=None, showticklabels=True),
+        st.plotly_chart(
+            count_figure(stats["labDeviceType"], "labDeviceType", "Device"),
+            theme=theme,
         )
-        st.plotly_chart(fig, theme=theme)
 
 else:
-    st.error("Error retrieving data. " + str(response.status_code))
+    # do not keep the failed request in the cache
+    get_biofile_stats.clear()
+    st.error("Error retrieving data. " + str(status_code))